@@ -0,0 +1,45 @@
+"""
+AWS Client Helpers for MetroVoice Podcast Automation
+Provides boto3 clients shared by all services in the process
+"""
+
+import threading
+import boto3
+from botocore.config import Config as BotoConfig
+from typing import Any, Dict
+from config import Config
+
+# Keep-alive connections with client-side adaptive retries. The pool is sized for
+# concurrent episodes that each upload several multipart parts at once.
+AWS_CLIENT_CONFIG = BotoConfig(
+    tcp_keepalive=True,
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+    max_pool_connections=32
+)
+
+_clients: Dict[str, Any] = {}
+_clients_lock = threading.Lock()
+
+def get_aws_client(service_name: str) -> Any:
+    """
+    Get the shared boto3 client for a service, creating it on first use
+    
+    Args:
+        service_name: The AWS service name, e.g. 's3' or 'sns'
+        
+    Returns:
+        The boto3 client
+    """
+    client = _clients.get(service_name)
+    if client is None:
+        # boto3's default session is not thread-safe, so client creation is serialized
+        with _clients_lock:
+            client = _clients.get(service_name)
+            if client is None:
+                client = boto3.client(
+                    service_name,
+                    region_name=Config.AWS_REGION,
+                    config=AWS_CLIENT_CONFIG
+                )
+                _clients[service_name] = client
+    return client
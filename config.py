@@ -4,12 +4,20 @@ Contains all settings, API keys, and series configurations
 """
 
 import os
-from typing import Dict, List, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Tuple
 from dataclasses import dataclass
 
 @dataclass
 class PodcastSeries:
     """Configuration for a podcast series"""
+    # Explicit __slots__ since dataclass(slots=True) needs Python 3.10 (Lambda runs 3.9)
+    __slots__ = (
+        "name", "description", "prompt_template",
+        "voice_id", "publish_frequency", "content_type"
+    )
+    
     name: str
     description: str
     prompt_template: str
@@ -20,6 +28,11 @@ class PodcastSeries:
 @dataclass
 class APIConfig:
     """API configuration settings"""
+    __slots__ = (
+        "perplexity_api_key", "elevenlabs_api_key",
+        "podbean_client_id", "podbean_client_secret"
+    )
+    
     perplexity_api_key: str
     elevenlabs_api_key: str
     podbean_client_id: str
@@ -32,17 +45,19 @@ class Config:
     AWS_REGION = "us-west-2"
     S3_BUCKET_NAME = "tmv-podcast-content"
     SNS_TOPIC_ARN = "arn:aws:sns:us-west-2:992382733262:Upload_Podcast_Trigger"
+    # Content-addressed cache of synthesized audio, keyed by TTS inputs
+    TTS_CACHE_PREFIX = "tts-cache/"
     
     # API Configuration - Use environment variables for security
     API_CONFIG = APIConfig(
-        perplexity_api_key=os.getenv("PERPLEXITY_API_KEY", ""),
-        elevenlabs_api_key=os.getenv("ELEVENLABS_API_KEY", ""),
-        podbean_client_id=os.getenv("PODBEAN_CLIENT_ID", ""),
-        podbean_client_secret=os.getenv("PODBEAN_CLIENT_SECRET", "")
+        perplexity_api_key=os.environ.get("PERPLEXITY_API_KEY", ""),
+        elevenlabs_api_key=os.environ.get("ELEVENLABS_API_KEY", ""),
+        podbean_client_id=os.environ.get("PODBEAN_CLIENT_ID", ""),
+        podbean_client_secret=os.environ.get("PODBEAN_CLIENT_SECRET", "")
     )
     
-    # Podcast Series Configurations
-    PODCAST_SERIES = {
+    # Podcast Series Configurations (read-only view, fixed at import time)
+    PODCAST_SERIES = MappingProxyType({
         "metro_business_brief": PodcastSeries(
             name="Metro Business Brief",
             description="Daily business news and startup insights",
@@ -118,11 +133,21 @@ class Config:
             publish_frequency="weekly",
             content_type="finance"
         )
-    }
+    })
+    
+    # Series IDs are fixed at import time, so compute them once
+    _ALL_SERIES_IDS = tuple(PODCAST_SERIES.keys())
+    
+    # Voice lookup for the TTS hot path, derived from PODCAST_SERIES
+    SERIES_VOICE_IDS = MappingProxyType({
+        series_id: series.voice_id for series_id, series in PODCAST_SERIES.items()
+    })
     
     # TTS Configuration
     TTS_CONFIG = {
         "model_id": "eleven_multilingual_v2",
+        # 64 kbps MP3 is plenty for spoken word and halves bytes vs the 128 kbps default
+        "output_format": "mp3_44100_64",
         "voice_settings": {
             "stability": 0.5,
             "similarity_boost": 0.8,
@@ -139,16 +164,18 @@ class Config:
     }
     
     @classmethod
+    @lru_cache(maxsize=256)  # PODCAST_SERIES is read-only, so lookups can be memoized
     def get_series_config(cls, series_id: str) -> PodcastSeries:
         """Get configuration for a specific podcast series"""
         return cls.PODCAST_SERIES.get(series_id)
     
     @classmethod
-    def get_all_series_ids(cls) -> List[str]:
+    def get_all_series_ids(cls) -> Tuple[str, ...]:
         """Get all available series IDs"""
-        return list(cls.PODCAST_SERIES.keys())
+        return cls._ALL_SERIES_IDS
     
     @classmethod
+    @lru_cache(maxsize=1)  # API_CONFIG is read once at import, so the result never changes
     def validate_config(cls) -> bool:
         """Validate that all required configuration is present"""
         required_keys = [
@@ -3,15 +3,35 @@ Content Generation Service for MetroVoice Podcast Automation
 Handles AI-powered content creation using Perplexity API
 """
 
-import json
+import re
 import requests
 import logging
 from typing import Optional, Dict, Any
 from datetime import datetime
 from config import Config
+from http_client import create_session
+from json_utils import json_loads
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on how much of an error response body is logged
+_MAX_ERROR_BODY_CHARS = 512
+
+# Read-only series mapping, resolved once at import
+_SERIES = Config.PODCAST_SERIES
+
+# Common error patterns that indicate the model refused or failed
+_ERROR_RE = re.compile(
+    r"i apologize|i'm sorry|i cannot|i'm unable|error|failed",
+    re.IGNORECASE
+)
+
+# Request headers only depend on the API key, which is fixed at import
+_HEADERS = {
+    "Content-Type": "application/json",
+    "Authorization": f"Bearer {Config.API_CONFIG.perplexity_api_key}"
+}
+
 class ContentGenerationError(Exception):
     """Custom exception for content generation errors"""
     pass
@@ -21,10 +41,15 @@ class ContentGenerator:
     
     def __init__(self):
         self.api_endpoint = "https://api.perplexity.ai/chat/completions"
-        self.headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {Config.API_CONFIG.perplexity_api_key}"
-        }
+        self.headers = _HEADERS
+        # Pooled keep-alive session; the adapter retries rate limits and server errors
+        self.session = create_session(
+            max_retries=Config.CONTENT_CONFIG["max_retries"],
+            backoff_factor=2,
+            allowed_methods=["POST"],
+            pool_connections=4,
+            pool_maxsize=8
+        )
     
     def generate_content(self, series_id: str, custom_prompt: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -39,7 +64,7 @@ class ContentGenerator:
         """
         try:
             # Get series configuration
-            series_config = Config.get_series_config(series_id)
+            series_config = _SERIES.get(series_id)
             if not series_config:
                 raise ContentGenerationError(f"Invalid series ID: {series_id}")
             
@@ -62,13 +87,13 @@ class ContentGenerator:
             
             # Process the response
             if response.status_code == 200:
-                result = response.json()
+                result = json_loads(response.content)
                 content = result["choices"][0]["message"]["content"]
                 
                 # Extract title and content
-                lines = content.strip().split('\n')
-                title = lines[0].strip()
-                story_content = '\n'.join(lines[1:]).strip()
+                head, _, rest = content.lstrip().partition('\n')
+                title = head.strip()
+                story_content = rest.strip()
                 
                 return {
                     "success": True,
@@ -82,7 +107,7 @@ class ContentGenerator:
                     "content_type": series_config.content_type
                 }
             else:
-                error_msg = f"API request failed with status {response.status_code}: {response.text}"
+                error_msg = f"API request failed with status {response.status_code}: {response.text[:_MAX_ERROR_BODY_CHARS]}"
                 logger.error(error_msg)
                 raise ContentGenerationError(error_msg)
                 
@@ -101,7 +126,7 @@ class ContentGenerator:
     
     def _make_request_with_retry(self, payload: Dict[str, Any]) -> requests.Response:
         """
-        Make API request with retry logic
+        Make API request over the pooled session (retries are handled by the adapter)
         
         Args:
             payload: The request payload
@@ -109,45 +134,17 @@ class ContentGenerator:
         Returns:
             API response
         """
-        max_retries = Config.CONTENT_CONFIG["max_retries"]
-        timeout = Config.CONTENT_CONFIG["timeout"]
-        
-        for attempt in range(max_retries):
-            try:
-                response = requests.post(
-                    self.api_endpoint,
-                    headers=self.headers,
-                    json=payload,
-                    timeout=timeout
-                )
-                
-                # If successful, return immediately
-                if response.status_code == 200:
-                    return response
-                
-                # If rate limited, wait and retry
-                if response.status_code == 429:
-                    wait_time = (attempt + 1) * 2  # Exponential backoff
-                    logger.warning(f"Rate limited, waiting {wait_time} seconds before retry {attempt + 1}")
-                    import time
-                    time.sleep(wait_time)
-                    continue
-                
-                # For other errors, don't retry
-                return response
-                
-            except requests.exceptions.Timeout:
-                logger.warning(f"Request timeout on attempt {attempt + 1}")
-                if attempt == max_retries - 1:
-                    raise ContentGenerationError("Request timed out after all retries")
-                continue
-            except requests.exceptions.ConnectionError:
-                logger.warning(f"Connection error on attempt {attempt + 1}")
-                if attempt == max_retries - 1:
-                    raise ContentGenerationError("Connection failed after all retries")
-                continue
-        
-        raise ContentGenerationError(f"Request failed after {max_retries} attempts")
+        try:
+            return self.session.post(
+                self.api_endpoint,
+                headers=self.headers,
+                json=payload,
+                timeout=Config.CONTENT_CONFIG["timeout"]
+            )
+        except requests.exceptions.Timeout:
+            raise ContentGenerationError("Request timed out after all retries")
+        except requests.exceptions.ConnectionError:
+            raise ContentGenerationError("Connection failed after all retries")
     
     def validate_content(self, content: str, min_words: int = 500) -> bool:
         """
@@ -160,31 +157,22 @@ class ContentGenerator:
         Returns:
             True if content is valid, False otherwise
         """
-        if not content or not content.strip():
+        # Cheapest checks first: each word needs at least one character plus a separator
+        if not content or len(content) < min_words * 2 or content.isspace():
             return False
         
-        word_count = len(content.split())
+        # Approximate word count from separators without building a token list
+        newline_count = content.count('\n')
+        word_count = content.count(' ') + newline_count + 1
         if word_count < min_words:
             return False
         
         # Check for basic content quality indicators
-        lines = content.split('\n')
-        if len(lines) < 3:  # Should have at least title and some content
+        if newline_count < 2:  # Should have at least title and some content
             return False
         
         # Check for common error patterns
-        error_indicators = [
-            "I apologize",
-            "I'm sorry",
-            "I cannot",
-            "I'm unable",
-            "Error",
-            "Failed"
-        ]
-        
-        content_lower = content.lower()
-        for indicator in error_indicators:
-            if indicator.lower() in content_lower:
-                return False
+        if _ERROR_RE.search(content):
+            return False
         
         return True 
\ No newline at end of file
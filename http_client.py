@@ -0,0 +1,44 @@
+"""
+HTTP Client Helpers for MetroVoice Podcast Automation
+Provides pooled, retrying HTTP sessions shared by the API services
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Iterable
+
+# Transient statuses worth retrying: rate limiting and server errors
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+def create_session(max_retries: int = 3, backoff_factor: float = 0.3,
+                   allowed_methods: Iterable[str] = ("GET", "HEAD"),
+                   pool_connections: int = 10, pool_maxsize: int = 20) -> requests.Session:
+    """
+    Create an HTTP session with keep-alive connection pooling and retries
+    
+    Args:
+        max_retries: Maximum number of retries per request
+        backoff_factor: Exponential backoff factor between retries
+        allowed_methods: HTTP methods that are retried on a transient status
+        pool_connections: Number of host connection pools to cache
+        pool_maxsize: Maximum connections kept per host
+        
+    Returns:
+        Configured requests session
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(allowed_methods),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
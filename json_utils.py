@@ -0,0 +1,24 @@
+"""
+JSON Helpers for MetroVoice Podcast Automation
+Uses orjson when it is installed and falls back to the standard library
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document (decode errors subclass ValueError either way)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj: Any) -> str:
+    """Serialize an object to a compact JSON string"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
@@ -5,12 +5,28 @@ Entry point for AWS Lambda function
 
 import json
 import logging
-import os
+import operator
 from typing import Dict, Any, List
 from datetime import datetime
 
+from config import Config
+from json_utils import json_dumps, json_loads
 from podcast_orchestrator import PodcastOrchestrator, PodcastOrchestratorError
 
+# Episode fields included in the handler response
+_EPISODE_FIELDS = (
+    "series_id",
+    "title",
+    "episode_id",
+    "podbean_url",
+    "generated_at",
+    "published_at"
+)
+_get_episode_fields = operator.attrgetter(*_EPISODE_FIELDS)
+
+# Any of these keys marks an event as a manual trigger
+_MANUAL_TRIGGER_KEYS = frozenset({"series_id", "series_ids", "action"})
+
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -26,9 +42,13 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     Returns:
         Dict containing response information
     """
+    # One timestamp per invocation, shared by the success and error responses
+    invoked_at = datetime.utcnow().isoformat()
+    
     try:
         logger.info("Starting MetroVoice Podcast Automation")
-        logger.info(f"Event: {json.dumps(event)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Event: %s", json.dumps(event))
         
         # Initialize orchestrator
         orchestrator = PodcastOrchestrator()
@@ -44,52 +64,25 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             }
         
         # Determine what to generate based on event
-        episodes_generated = []
-        
-        if _is_scheduled_event(event):
-            # Generate episodes based on schedule
-            logger.info("Processing scheduled episode generation")
-            episodes_generated = orchestrator.generate_scheduled_episodes()
-            
-        elif _is_manual_trigger(event):
-            # Generate specific episodes based on event parameters
-            logger.info("Processing manual episode generation")
-            episodes_generated = _process_manual_trigger(event, orchestrator)
-            
-        elif _is_sns_trigger(event):
-            # Process SNS notification (legacy support)
-            logger.info("Processing SNS trigger")
-            episodes_generated = _process_sns_trigger(event, orchestrator)
-            
-        else:
-            # Default: generate all series
-            logger.info("No specific trigger found, generating all series")
-            all_series = orchestrator.content_generator.config.get_all_series_ids()
-            episodes_generated = orchestrator.generate_multiple_episodes(all_series)
+        trigger = _classify_event(event)
+        episodes_generated = _TRIGGER_HANDLERS[trigger](event, orchestrator)
         
         # Prepare response
         response_data = {
             "success": True,
             "episodes_generated": len(episodes_generated),
             "episodes": [
-                {
-                    "series_id": episode.series_id,
-                    "title": episode.title,
-                    "episode_id": episode.episode_id,
-                    "podbean_url": episode.podbean_url,
-                    "generated_at": episode.generated_at,
-                    "published_at": episode.published_at
-                }
+                dict(zip(_EPISODE_FIELDS, _get_episode_fields(episode)))
                 for episode in episodes_generated
             ],
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": invoked_at
         }
         
-        logger.info(f"Successfully generated {len(episodes_generated)} episodes")
+        logger.info("Successfully generated %d episodes", len(episodes_generated))
         
         return {
             "statusCode": 200,
-            "body": json.dumps(response_data, indent=2)
+            "body": json_dumps(response_data)
         }
         
     except PodcastOrchestratorError as e:
@@ -100,7 +93,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             "body": json.dumps({
                 "error": "Podcast orchestration failed",
                 "message": str(e),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": invoked_at
             })
         }
         
@@ -112,37 +105,40 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             "body": json.dumps({
                 "error": "Internal server error",
                 "message": str(e),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": invoked_at
             })
         }
 
-def _is_scheduled_event(event: Dict[str, Any]) -> bool:
-    """Check if event is a scheduled CloudWatch event"""
-    return (
-        "source" in event and 
-        event.get("source") == "aws.events" and
-        "detail-type" in event and
-        event.get("detail-type") == "Scheduled Event"
-    )
+def _classify_event(event: Dict[str, Any]) -> str:
+    """Classify the event as a scheduled, manual, SNS or default trigger"""
+    # Scheduled CloudWatch event
+    if event.get("source") == "aws.events" and event.get("detail-type") == "Scheduled Event":
+        return "scheduled"
+    
+    # Manual trigger with specific parameters
+    if not _MANUAL_TRIGGER_KEYS.isdisjoint(event):
+        return "manual"
+    
+    # SNS notification
+    records = event.get("Records")
+    if records and "Sns" in records[0]:
+        return "sns"
+    
+    return "default"
 
-def _is_manual_trigger(event: Dict[str, Any]) -> bool:
-    """Check if event is a manual trigger with specific parameters"""
-    return (
-        "series_id" in event or
-        "series_ids" in event or
-        "action" in event
-    )
+def _process_scheduled_event(event: Dict[str, Any], orchestrator: PodcastOrchestrator) -> List:
+    """Generate episodes based on schedule"""
+    logger.info("Processing scheduled episode generation")
+    return orchestrator.generate_scheduled_episodes()
 
-def _is_sns_trigger(event: Dict[str, Any]) -> bool:
-    """Check if event is an SNS notification"""
-    return (
-        "Records" in event and
-        len(event["Records"]) > 0 and
-        "Sns" in event["Records"][0]
-    )
+def _process_default_trigger(event: Dict[str, Any], orchestrator: PodcastOrchestrator) -> List:
+    """Generate episodes for all series"""
+    logger.info("No specific trigger found, generating all series")
+    return orchestrator.generate_multiple_episodes(Config.get_all_series_ids())
 
 def _process_manual_trigger(event: Dict[str, Any], orchestrator: PodcastOrchestrator) -> List:
     """Process manual trigger event"""
+    logger.info("Processing manual episode generation")
     episodes_generated = []
     
     # Handle single series
@@ -157,7 +153,7 @@ def _process_manual_trigger(event: Dict[str, Any], orchestrator: PodcastOrchestr
             )
             episodes_generated.append(episode)
         except PodcastOrchestratorError as e:
-            logger.error(f"Failed to generate episode for {series_id}: {str(e)}")
+            logger.error("Failed to generate episode for %s: %s", series_id, e)
     
     # Handle multiple series
     elif "series_ids" in event:
@@ -176,19 +172,20 @@ def _process_manual_trigger(event: Dict[str, Any], orchestrator: PodcastOrchestr
         if action == "status":
             # Return status instead of generating episodes
             status = orchestrator.get_series_status()
-            logger.info(f"Series status: {json.dumps(status, indent=2)}")
+            logger.info("Series status: %s", json.dumps(status, indent=2))
             return []
         
         elif action == "validate":
             # Validate configuration
-            is_valid = orchestrator.validate_configuration()
-            logger.info(f"Configuration validation: {is_valid}")
+            is_valid = orchestrator.validate_configuration(force=True)
+            logger.info("Configuration validation: %s", is_valid)
             return []
     
     return episodes_generated
 
 def _process_sns_trigger(event: Dict[str, Any], orchestrator: PodcastOrchestrator) -> List:
     """Process SNS trigger event (legacy support)"""
+    logger.info("Processing SNS trigger")
     episodes_generated = []
     
     for record in event["Records"]:
@@ -197,9 +194,9 @@ def _process_sns_trigger(event: Dict[str, Any], orchestrator: PodcastOrchestrato
             
             # Try to parse as JSON first
             try:
-                message_data = json.loads(sns_message)
+                message_data = json_loads(sns_message)
                 series_id = message_data.get("series_id", "metro_business_brief")
-            except json.JSONDecodeError:
+            except ValueError:  # json and orjson decode errors both subclass ValueError
                 # Fallback to treating as plain text (legacy behavior)
                 series_id = "metro_business_brief"
             
@@ -207,11 +204,19 @@ def _process_sns_trigger(event: Dict[str, Any], orchestrator: PodcastOrchestrato
             episodes_generated.append(episode)
             
         except Exception as e:
-            logger.error(f"Error processing SNS record: {str(e)}")
+            logger.error("Error processing SNS record: %s", e)
             continue
     
     return episodes_generated
 
+# Event handlers keyed by the trigger type returned from _classify_event
+_TRIGGER_HANDLERS = {
+    "scheduled": _process_scheduled_event,
+    "manual": _process_manual_trigger,
+    "sns": _process_sns_trigger,
+    "default": _process_default_trigger
+}
+
 # Additional utility functions for testing and debugging
 def get_series_status(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Get status of all podcast series"""
@@ -236,7 +241,7 @@ def validate_config(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Validate system configuration"""
     try:
         orchestrator = PodcastOrchestrator()
-        is_valid = orchestrator.validate_configuration()
+        is_valid = orchestrator.validate_configuration(force=True)
         
         return {
             "statusCode": 200,
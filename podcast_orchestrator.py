@@ -3,20 +3,34 @@ Podcast Orchestrator for MetroVoice Podcast Automation
 Main orchestrator that coordinates content generation, TTS, and publishing
 """
 
-import json
+import asyncio
 import logging
-import boto3
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple
+from datetime import datetime
 from dataclasses import dataclass
 
-from config import Config
+from aws_clients import get_aws_client
+from config import Config, PodcastSeries
+from json_utils import json_dumps
 from content_generator import ContentGenerator, ContentGenerationError
 from tts_service import TTSService, TTSServiceError
 from podcast_publisher import PodcastPublisher, PodcastPublisherError
 
 logger = logging.getLogger(__name__)
 
+# Maximum entries SNS accepts in one publish_batch call
+SNS_PUBLISH_BATCH_SIZE = 10
+
+# Publish frequency -> whether an episode is due on a given date.
+# This is a simplified schedule; unknown frequencies are never due.
+_SCHEDULE_MATCHERS = {
+    "daily": lambda day: True,
+    "weekly": lambda day: day.weekday() == 0,  # Mondays
+    "monthly": lambda day: day.day == 1  # First day of the month
+}
+
 @dataclass
 class EpisodeMetadata:
     """Metadata for a generated episode"""
@@ -36,11 +50,22 @@ class PodcastOrchestratorError(Exception):
 class PodcastOrchestrator:
     """Main orchestrator for podcast automation"""
     
-    def __init__(self):
+    # How long a successful configuration check stays valid in a warm container
+    VALIDATION_TTL_SECONDS = 300
+    _validated_at: Optional[float] = None
+    
+    def __init__(self, max_concurrent_episodes: int = 4):
+        """
+        Args:
+            max_concurrent_episodes: Upper bound on episodes generated at the same time,
+                to stay within provider rate limits
+        """
+        self.max_concurrent_episodes = max_concurrent_episodes
         self.content_generator = ContentGenerator()
         self.tts_service = TTSService()
         self.publisher = PodcastPublisher()
-        self.sns_client = boto3.client('sns', region_name=Config.AWS_REGION)
+        self.sns_client = get_aws_client('sns')
+        self.s3_client = get_aws_client('s3')
         
         # Initialize logging
         logging.basicConfig(
@@ -49,7 +74,7 @@ class PodcastOrchestrator:
         )
     
     def generate_episode(self, series_id: str, custom_prompt: Optional[str] = None,
-                        auto_publish: bool = True) -> EpisodeMetadata:
+                        auto_publish: bool = True, notify: bool = True) -> EpisodeMetadata:
         """
         Generate a complete episode for a series
         
@@ -57,6 +82,7 @@ class PodcastOrchestrator:
             series_id: The podcast series ID
             custom_prompt: Optional custom prompt
             auto_publish: Whether to automatically publish the episode
+            notify: Whether to send the SNS notification (batch callers send them together)
             
         Returns:
             EpisodeMetadata object with episode information
@@ -120,7 +146,8 @@ class PodcastOrchestrator:
             self.tts_service.cleanup_old_files(series_id)
             
             # Step 5: Send notification
-            self._send_notification(episode_metadata)
+            if notify:
+                self._send_notification(episode_metadata)
             
             logger.info(f"Episode generation completed successfully for {series_id}")
             return episode_metadata
@@ -148,20 +175,64 @@ class PodcastOrchestrator:
         Returns:
             List of EpisodeMetadata objects
         """
+        if not series_ids:
+            return []
+        
+        coro = self.generate_multiple_episodes_async(series_ids, custom_prompts, auto_publish)
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        
+        # Called from inside a running event loop (e.g. a notebook); asyncio.run cannot
+        # nest, so drive the batch on a separate thread with its own loop
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+    
+    async def generate_multiple_episodes_async(self, series_ids: List[str],
+                                               custom_prompts: Optional[Dict[str, str]] = None,
+                                               auto_publish: bool = True) -> List[EpisodeMetadata]:
+        """
+        Generate episodes for multiple series concurrently
+        
+        Each episode pipeline is network-bound, so episodes run on worker threads
+        with at most max_concurrent_episodes in flight at once.
+        
+        Args:
+            series_ids: List of series IDs to generate episodes for
+            custom_prompts: Optional dict of custom prompts for specific series
+            auto_publish: Whether to automatically publish episodes
+            
+        Returns:
+            List of EpisodeMetadata objects, in the order of series_ids
+        """
+        loop = asyncio.get_running_loop()
+        
+        # The pool size is the concurrency bound: a worker slot is only freed once
+        # its episode pipeline has actually finished
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_episodes) as executor:
+            outcomes = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        executor, self.generate_episode, series_id,
+                        custom_prompts.get(series_id) if custom_prompts else None,
+                        auto_publish, False
+                    )
+                    for series_id in series_ids
+                ),
+                return_exceptions=True
+            )
+        
         results = []
+        for series_id, outcome in zip(series_ids, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Failed to generate episode for {series_id}: {str(outcome)}")
+            else:
+                results.append(outcome)
         
-        for series_id in series_ids:
-            try:
-                custom_prompt = custom_prompts.get(series_id) if custom_prompts else None
-                episode_metadata = self.generate_episode(
-                    series_id, custom_prompt, auto_publish
-                )
-                results.append(episode_metadata)
-                
-            except PodcastOrchestratorError as e:
-                logger.error(f"Failed to generate episode for {series_id}: {str(e)}")
-                # Continue with other series
-                continue
+        # Notify once the whole batch is done, in a single pass over the episodes
+        self._send_batch_notifications(results)
         
         return results
     
@@ -173,11 +244,15 @@ class PodcastOrchestrator:
             List of EpisodeMetadata objects for generated episodes
         """
         today = datetime.utcnow().date()
-        episodes_to_generate = []
         
-        for series_id, series_config in Config.PODCAST_SERIES.items():
-            if self._should_generate_episode(series_id, series_config, today):
-                episodes_to_generate.append(series_id)
+        # Resolve which publish frequencies are due today once, then filter series by it
+        due_frequencies = {
+            frequency for frequency, is_due in _SCHEDULE_MATCHERS.items() if is_due(today)
+        }
+        episodes_to_generate = [
+            series_id for series_id, series_config in Config.PODCAST_SERIES.items()
+            if series_config.publish_frequency in due_frequencies
+        ]
         
         if episodes_to_generate:
             logger.info(f"Generating scheduled episodes for: {episodes_to_generate}")
@@ -186,31 +261,25 @@ class PodcastOrchestrator:
             logger.info("No episodes scheduled for generation today")
             return []
     
-    def _should_generate_episode(self, series_id: str, series_config, today: datetime.date) -> bool:
+    def _build_notification(self, episode_metadata: EpisodeMetadata) -> Dict[str, Any]:
         """
-        Determine if an episode should be generated based on schedule
+        Build the SNS notification message for an episode
         
         Args:
-            series_id: The series ID
-            series_config: The series configuration
-            today: Today's date
+            episode_metadata: The episode metadata
             
         Returns:
-            True if episode should be generated
+            Dict containing the notification message
         """
-        # This is a simplified schedule check
-        # In production, you might want to use a more sophisticated scheduling system
-        
-        if series_config.publish_frequency == "daily":
-            return True
-        elif series_config.publish_frequency == "weekly":
-            # Generate on Mondays
-            return today.weekday() == 0
-        elif series_config.publish_frequency == "monthly":
-            # Generate on the first day of the month
-            return today.day == 1
-        
-        return False
+        return {
+            "series_id": episode_metadata.series_id,
+            "title": episode_metadata.title,
+            "s3_key": episode_metadata.s3_key,
+            "episode_id": episode_metadata.episode_id,
+            "podbean_url": episode_metadata.podbean_url,
+            "generated_at": episode_metadata.generated_at,
+            "published_at": episode_metadata.published_at
+        }
     
     def _send_notification(self, episode_metadata: EpisodeMetadata) -> None:
         """
@@ -220,19 +289,11 @@ class PodcastOrchestrator:
             episode_metadata: The episode metadata
         """
         try:
-            message = {
-                "series_id": episode_metadata.series_id,
-                "title": episode_metadata.title,
-                "s3_key": episode_metadata.s3_key,
-                "episode_id": episode_metadata.episode_id,
-                "podbean_url": episode_metadata.podbean_url,
-                "generated_at": episode_metadata.generated_at,
-                "published_at": episode_metadata.published_at
-            }
+            message = self._build_notification(episode_metadata)
             
             self.sns_client.publish(
                 TopicArn=Config.SNS_TOPIC_ARN,
-                Message=json.dumps(message),
+                Message=json_dumps(message),
                 Subject=f"New Episode Generated: {episode_metadata.title}"
             )
             
@@ -241,58 +302,110 @@ class PodcastOrchestrator:
         except Exception as e:
             logger.warning(f"Failed to send notification: {str(e)}")
     
-    def get_series_status(self) -> Dict[str, Any]:
+    def _send_batch_notifications(self, episodes: List[EpisodeMetadata]) -> None:
         """
-        Get status of all podcast series
+        Send notifications for a batch of generated episodes using SNS publish_batch
         
-        Returns:
-            Dict containing status information for all series
+        Args:
+            episodes: The generated episodes
         """
-        status = {}
+        if len(episodes) == 1:
+            self._send_notification(episodes[0])
+            return
         
-        for series_id, series_config in Config.PODCAST_SERIES.items():
+        for start in range(0, len(episodes), SNS_PUBLISH_BATCH_SIZE):
+            chunk = episodes[start:start + SNS_PUBLISH_BATCH_SIZE]
             try:
-                # Get recent episodes from S3
-                s3_client = boto3.client('s3', region_name=Config.AWS_REGION)
-                prefix = f"episodes/{series_id}/"
-                
-                response = s3_client.list_objects_v2(
-                    Bucket=Config.S3_BUCKET_NAME,
-                    Prefix=prefix,
-                    MaxKeys=5
+                response = self.sns_client.publish_batch(
+                    TopicArn=Config.SNS_TOPIC_ARN,
+                    PublishBatchRequestEntries=[
+                        {
+                            "Id": str(index),
+                            "Message": json_dumps(self._build_notification(episode_metadata)),
+                            "Subject": f"New Episode Generated: {episode_metadata.title}"
+                        }
+                        for index, episode_metadata in enumerate(chunk)
+                    ]
                 )
                 
-                recent_episodes = []
-                if 'Contents' in response:
-                    for obj in response['Contents']:
-                        recent_episodes.append({
-                            "filename": obj['Key'],
-                            "size": obj['Size'],
-                            "last_modified": obj['LastModified'].isoformat()
-                        })
-                
-                status[series_id] = {
-                    "name": series_config.name,
-                    "description": series_config.description,
-                    "publish_frequency": series_config.publish_frequency,
-                    "content_type": series_config.content_type,
-                    "recent_episodes": recent_episodes,
-                    "episode_count": len(recent_episodes)
-                }
+                for failure in response.get("Failed", []):
+                    logger.warning(f"Failed to send notification: {failure.get('Message')}")
+                logger.info(f"Sent {len(response.get('Successful', []))} notifications")
                 
             except Exception as e:
-                logger.warning(f"Error getting status for {series_id}: {str(e)}")
-                status[series_id] = {"error": str(e)}
+                logger.warning(f"Failed to send batch notification: {str(e)}")
+    
+    def get_series_status(self) -> Dict[str, Any]:
+        """
+        Get status of all podcast series
         
-        return status
+        Returns:
+            Dict containing status information for all series
+        """
+        # One S3 listing per series; run them concurrently since each is a network round trip
+        series_items = list(Config.PODCAST_SERIES.items())
+        with ThreadPoolExecutor(max_workers=min(16, len(series_items))) as executor:
+            return dict(executor.map(self._get_single_series_status, series_items))
     
-    def validate_configuration(self) -> bool:
+    def _get_single_series_status(self, series_item: Tuple[str, PodcastSeries]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Get status of one podcast series
+        
+        Args:
+            series_item: The (series ID, series configuration) pair
+            
+        Returns:
+            Tuple of series ID and its status information
+        """
+        series_id, series_config = series_item
+        
+        try:
+            # Get recent episodes from S3
+            prefix = f"episodes/{series_id}/"
+            
+            response = self.s3_client.list_objects_v2(
+                Bucket=Config.S3_BUCKET_NAME,
+                Prefix=prefix,
+                MaxKeys=5
+            )
+            
+            recent_episodes = []
+            if 'Contents' in response:
+                for obj in response['Contents']:
+                    recent_episodes.append({
+                        "filename": obj['Key'],
+                        "size": obj['Size'],
+                        "last_modified": obj['LastModified'].isoformat()
+                    })
+            
+            return series_id, {
+                "name": series_config.name,
+                "description": series_config.description,
+                "publish_frequency": series_config.publish_frequency,
+                "content_type": series_config.content_type,
+                "recent_episodes": recent_episodes,
+                "episode_count": len(recent_episodes)
+            }
+            
+        except Exception as e:
+            logger.warning(f"Error getting status for {series_id}: {str(e)}")
+            return series_id, {"error": str(e)}
+    
+    def validate_configuration(self, force: bool = False) -> bool:
         """
         Validate that all configuration is properly set up
         
+        Args:
+            force: Always check S3 and SNS instead of reusing a recent successful check
+            
         Returns:
             True if configuration is valid
         """
+        validated_at = PodcastOrchestrator._validated_at
+        if (not force and validated_at is not None
+                and time.monotonic() - validated_at < self.VALIDATION_TTL_SECONDS):
+            return True
+        
         try:
             # Check API keys
             if not Config.validate_config():
@@ -300,13 +413,13 @@ class PodcastOrchestrator:
                 return False
             
             # Check AWS permissions
-            s3_client = boto3.client('s3', region_name=Config.AWS_REGION)
-            s3_client.head_bucket(Bucket=Config.S3_BUCKET_NAME)
+            self.s3_client.head_bucket(Bucket=Config.S3_BUCKET_NAME)
             
             # Check SNS topic
             self.sns_client.get_topic_attributes(TopicArn=Config.SNS_TOPIC_ARN)
             
             logger.info("Configuration validation successful")
+            PodcastOrchestrator._validated_at = time.monotonic()
             return True
             
         except Exception as e:
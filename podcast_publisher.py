@@ -4,12 +4,16 @@ Handles uploading episodes to Podbean platform
 """
 
 import requests
-import boto3
 import os
 import logging
-from typing import Dict, Any, Optional, Tuple
+import threading
+import time
+from typing import ClassVar, Dict, Any, Optional, Tuple
 from datetime import datetime
+from aws_clients import get_aws_client
 from config import Config
+from http_client import create_session
+from json_utils import json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -17,15 +21,42 @@ class PodcastPublisherError(Exception):
     """Custom exception for podcast publishing errors"""
     pass
 
+class _SizedStream:
+    """
+    Read-only stream with a known length
+    
+    requests falls back to chunked transfer encoding for streams it cannot size,
+    which presigned upload URLs reject; exposing __len__ makes it send Content-Length.
+    """
+    
+    def __init__(self, body: Any, size: int):
+        self._body = body
+        self._size = size
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def read(self, amt: int = -1) -> bytes:
+        return self._body.read(amt if amt is not None and amt >= 0 else None)
+
 class PodcastPublisher:
     """Handles podcast episode publishing to Podbean"""
     
+    # Access tokens shared by all publisher instances in the process, keyed by client ID,
+    # so warm Lambda invocations reuse a token instead of requesting a new one
+    _token_cache: ClassVar[Dict[str, Tuple[str, float]]] = {}
+    _token_lock: ClassVar[threading.Lock] = threading.Lock()
+    
+    # Refresh tokens this many seconds before Podbean expires them
+    TOKEN_EXPIRY_MARGIN_SECONDS = 120
+    
     def __init__(self):
         self.client_id = Config.API_CONFIG.podbean_client_id
         self.client_secret = Config.API_CONFIG.podbean_client_secret
-        self.access_token = None
-        self.token_expiry = None
-        self.s3_client = boto3.client('s3', region_name=Config.AWS_REGION)
+        # Pooled keep-alive session for all Podbean calls; only GET/HEAD are retried
+        # on a transient status since episode creation is not idempotent
+        self.session = create_session()
+        self.s3_client = get_aws_client('s3')
     
     def publish_episode(self, series_id: str, title: str, s3_key: str, 
                        description: Optional[str] = None) -> Dict[str, Any]:
@@ -45,17 +76,19 @@ class PodcastPublisher:
             # Get access token
             access_token = self._get_access_token()
             
-            # Download file from S3 to local temp
-            local_file_path = self._download_from_s3(s3_key)
+            # Open the audio in S3 as a stream
+            audio_body, file_size = self._open_s3_audio(s3_key)
             
-            # Get presigned URL for upload
-            file_size = os.path.getsize(local_file_path)
-            presigned_url, file_key = self._get_presigned_url(
-                access_token, os.path.basename(s3_key), file_size
-            )
-            
-            # Upload file to Podbean
-            self._upload_to_podbean(local_file_path, presigned_url)
+            try:
+                # Get presigned URL for upload
+                presigned_url, file_key = self._get_presigned_url(
+                    access_token, os.path.basename(s3_key), file_size
+                )
+                
+                # Pipe the S3 stream straight into the Podbean upload
+                self._upload_to_podbean(audio_body, file_size, presigned_url)
+            finally:
+                audio_body.close()
             
             # Create episode
             episode_data = self._create_episode_data(
@@ -65,9 +98,6 @@ class PodcastPublisher:
             # Publish episode
             episode_response = self._publish_episode_to_podbean(episode_data)
             
-            # Cleanup
-            os.remove(local_file_path)
-            
             return {
                 "success": True,
                 "series_id": series_id,
@@ -85,52 +115,51 @@ class PodcastPublisher:
     
     def _get_access_token(self) -> str:
         """Get or refresh Podbean access token"""
-        if self.access_token and self.token_expiry and datetime.utcnow() < self.token_expiry:
-            return self.access_token
-        
-        token_url = 'https://api.podbean.com/v1/oauth/token'
-        headers = {'Content-Type': 'application/json'}
-        data = {
-            'client_id': self.client_id,
-            'client_secret': self.client_secret,
-            'grant_type': 'client_credentials'
-        }
-        
-        try:
-            response = requests.post(token_url, headers=headers, json=data)
-            if response.status_code == 200:
-                token_data = response.json()
-                self.access_token = token_data['access_token']
-                # Set expiry to 1 hour from now (with some buffer)
-                self.token_expiry = datetime.utcnow().replace(
-                    second=0, microsecond=0
-                ).replace(minute=datetime.utcnow().minute + 55)
-                return self.access_token
-            else:
-                error_msg = f"Failed to obtain access token. Status: {response.status_code}"
+        with PodcastPublisher._token_lock:
+            cached = PodcastPublisher._token_cache.get(self.client_id)
+            if cached and time.monotonic() < cached[1]:
+                return cached[0]
+            
+            token_url = 'https://api.podbean.com/v1/oauth/token'
+            headers = {'Content-Type': 'application/json'}
+            data = {
+                'client_id': self.client_id,
+                'client_secret': self.client_secret,
+                'grant_type': 'client_credentials'
+            }
+            
+            try:
+                response = self.session.post(token_url, headers=headers, json=data)
+                if response.status_code == 200:
+                    token_data = json_loads(response.content)
+                    access_token = token_data['access_token']
+                    # Expire slightly before Podbean does (tokens default to 1 hour)
+                    expires_in = token_data.get('expires_in', 3600)
+                    expires_at = time.monotonic() + expires_in - self.TOKEN_EXPIRY_MARGIN_SECONDS
+                    PodcastPublisher._token_cache[self.client_id] = (access_token, expires_at)
+                    return access_token
+                else:
+                    error_msg = f"Failed to obtain access token. Status: {response.status_code}"
+                    logger.error(error_msg)
+                    raise PodcastPublisherError(error_msg)
+                    
+            except requests.exceptions.RequestException as e:
+                error_msg = f"Network error getting access token: {str(e)}"
                 logger.error(error_msg)
                 raise PodcastPublisherError(error_msg)
-                
-        except requests.exceptions.RequestException as e:
-            error_msg = f"Network error getting access token: {str(e)}"
-            logger.error(error_msg)
-            raise PodcastPublisherError(error_msg)
     
-    def _download_from_s3(self, s3_key: str) -> str:
-        """Download file from S3 to local temp directory"""
-        local_file_path = f"/tmp/{os.path.basename(s3_key)}"
-        
+    def _open_s3_audio(self, s3_key: str) -> Tuple[Any, int]:
+        """Open an audio file in S3 as a stream and return it with its size"""
         try:
-            self.s3_client.download_file(
-                Config.S3_BUCKET_NAME, 
-                s3_key, 
-                local_file_path
+            obj = self.s3_client.get_object(
+                Bucket=Config.S3_BUCKET_NAME,
+                Key=s3_key
             )
-            logger.info(f"Downloaded {s3_key} to {local_file_path}")
-            return local_file_path
+            logger.info(f"Streaming {s3_key} from S3")
+            return obj['Body'], obj['ContentLength']
             
         except Exception as e:
-            error_msg = f"Error downloading from S3: {str(e)}"
+            error_msg = f"Error reading from S3: {str(e)}"
             logger.error(error_msg)
             raise PodcastPublisherError(error_msg)
     
@@ -146,9 +175,9 @@ class PodcastPublisher:
         }
         
         try:
-            response = requests.get(upload_authorize_url, params=params)
+            response = self.session.get(upload_authorize_url, params=params)
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 return data.get('presigned_url'), data.get('file_key')
             else:
                 error_msg = f"Failed to get presigned URL. Status: {response.status_code}"
@@ -160,13 +189,16 @@ class PodcastPublisher:
             logger.error(error_msg)
             raise PodcastPublisherError(error_msg)
     
-    def _upload_to_podbean(self, local_file_path: str, presigned_url: str) -> None:
-        """Upload file to Podbean using presigned URL"""
+    def _upload_to_podbean(self, audio_body: Any, file_size: int, presigned_url: str) -> None:
+        """Upload an audio stream to Podbean using presigned URL"""
         headers = {'Content-Type': 'audio/mpeg'}
         
         try:
-            with open(local_file_path, 'rb') as file:
-                response = requests.put(presigned_url, data=file, headers=headers)
+            response = self.session.put(
+                presigned_url,
+                data=_SizedStream(audio_body, file_size),
+                headers=headers
+            )
             
             if response.status_code != 200:
                 error_msg = f"Failed to upload to Podbean. Status: {response.status_code}"
@@ -207,10 +239,10 @@ class PodcastPublisher:
         upload_url = 'https://api.podbean.com/v1/episodes'
         
         try:
-            response = requests.post(upload_url, data=episode_data)
+            response = self.session.post(upload_url, data=episode_data)
             
             if response.status_code == 200:
-                episode_info = response.json()
+                episode_info = json_loads(response.content)
                 logger.info(f"Episode published successfully: {episode_info.get('id')}")
                 return episode_info
             else:
@@ -230,9 +262,9 @@ class PodcastPublisher:
         params = {'access_token': access_token}
         
         try:
-            response = requests.get(url, params=params)
+            response = self.session.get(url, params=params)
             if response.status_code == 200:
-                return response.json()
+                return json_loads(response.content)
             else:
                 logger.warning(f"Could not get episode status: {response.status_code}")
                 return {}
@@ -3,16 +3,33 @@ Text-to-Speech Service for MetroVoice Podcast Automation
 Handles audio generation using ElevenLabs API
 """
 
+import base64
+import hashlib
+import json
+import re
 import requests
-import boto3
 import logging
+import threading
+from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from io import BytesIO
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from datetime import datetime
+from aws_clients import get_aws_client
 from config import Config
+from http_client import create_session
+
+try:
+    from mutagen.mp3 import MP3
+except ImportError:  # mutagen is optional; fall back to a size-based estimate
+    MP3 = None
 
 logger = logging.getLogger(__name__)
 
+# Sentence boundaries used to split long scripts into synthesis segments
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
+
 class TTSServiceError(Exception):
     """Custom exception for TTS service errors"""
     pass
@@ -20,10 +37,27 @@ class TTSServiceError(Exception):
 class TTSService:
     """Handles text-to-speech conversion using ElevenLabs API"""
     
+    # S3 multipart parts must be at least 5 MiB (except the last one)
+    S3_PART_SIZE = 5 * 1024 * 1024
+    # Audio below this size is stored with a single put_object instead of multipart
+    SINGLE_PUT_MAX_SIZE = 8 * 1024 * 1024
+    # Parts uploaded in parallel while the TTS stream is still being read
+    UPLOAD_WORKERS = 4
+    # Long scripts are split into segments of about this many words
+    TTS_SEGMENT_WORDS = 400
+    # Segments of one script synthesized in parallel
+    TTS_WORKERS = 4
+    # ElevenLabs requests in flight across all episodes in the process, so that
+    # concurrent episodes times segment workers cannot exceed the API rate limits
+    MAX_TTS_REQUESTS = 4
+    _tts_request_slots = threading.BoundedSemaphore(MAX_TTS_REQUESTS)
+    
     def __init__(self):
         self.api_key = Config.API_CONFIG.elevenlabs_api_key
         self.base_url = "https://api.elevenlabs.io/v1"
-        self.s3_client = boto3.client('s3', region_name=Config.AWS_REGION)
+        # Pooled keep-alive session; synthesis requests are retried on rate limits
+        self.session = create_session(allowed_methods=["POST"])
+        self.s3_client = get_aws_client('s3')
     
     def generate_audio(self, text: str, series_id: str, title: str) -> Dict[str, Any]:
         """
@@ -38,21 +72,24 @@ class TTSService:
             Dict containing audio file information
         """
         try:
-            # Get series configuration for voice settings
-            series_config = Config.get_series_config(series_id)
-            if not series_config:
+            # Get the voice configured for the series
+            voice_id = Config.SERIES_VOICE_IDS.get(series_id)
+            if not voice_id:
                 raise TTSServiceError(f"Invalid series ID: {series_id}")
             
-            # Generate audio using ElevenLabs API
-            audio_stream = self._generate_audio_stream(text, series_config.voice_id)
-            
             # Create filename with timestamp
             timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
             filename = f"{series_id}_{timestamp}.mp3"
             
-            # Upload to S3
             s3_key = f"episodes/{series_id}/{filename}"
-            self._upload_to_s3(audio_stream, s3_key)
+            cache_key = self._tts_cache_key(text, voice_id)
+            
+            # Reuse previously synthesized audio for identical input
+            file_size = self._copy_from_tts_cache(cache_key, s3_key)
+            if file_size is None:
+                # Stream audio from ElevenLabs straight into S3
+                file_size = self._stream_tts_to_s3(text, voice_id, s3_key)
+                self._store_in_tts_cache(s3_key, cache_key)
             
             return {
                 "success": True,
@@ -62,7 +99,7 @@ class TTSService:
                 "s3_key": s3_key,
                 "s3_bucket": Config.S3_BUCKET_NAME,
                 "generated_at": datetime.utcnow().isoformat(),
-                "file_size": len(audio_stream.getvalue())
+                "file_size": file_size
             }
             
         except Exception as e:
@@ -70,21 +107,182 @@ class TTSService:
             logger.error(error_msg)
             raise TTSServiceError(error_msg)
     
-    def _generate_audio_stream(self, text: str, voice_id: str) -> BytesIO:
+    def _tts_cache_key(self, text: str, voice_id: str) -> str:
         """
-        Generate audio stream from text using ElevenLabs API
+        Build the S3 key for cached audio of the given text and voice
         
         Args:
             text: The text to convert to speech
             voice_id: The voice ID to use
             
         Returns:
-            BytesIO object containing the audio data
+            S3 key under the TTS cache prefix
+        """
+        tts_settings = json.dumps(Config.TTS_CONFIG, sort_keys=True)
+        digest = hashlib.sha256(f"{voice_id}|{tts_settings}|{text}".encode("utf-8")).hexdigest()
+        return f"{Config.TTS_CACHE_PREFIX}{digest}.mp3"
+    
+    def _copy_from_tts_cache(self, cache_key: str, s3_key: str) -> Optional[int]:
+        """
+        Copy cached audio to the episode key if present (server-side copy)
+        
+        Args:
+            cache_key: The S3 key of the cached audio
+            s3_key: The S3 key for the episode file
+            
+        Returns:
+            Size of the audio in bytes, or None on a cache miss
+        """
+        try:
+            head = self.s3_client.head_object(Bucket=Config.S3_BUCKET_NAME, Key=cache_key)
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') not in ('404', 'NoSuchKey', 'NotFound'):
+                logger.warning(f"Error checking TTS cache: {str(e)}")
+            return None
+        
+        try:
+            self.s3_client.copy_object(
+                Bucket=Config.S3_BUCKET_NAME,
+                Key=s3_key,
+                CopySource={'Bucket': Config.S3_BUCKET_NAME, 'Key': cache_key}
+            )
+        except Exception as e:
+            logger.warning(f"Error copying cached audio, regenerating: {str(e)}")
+            return None
+        
+        logger.info(f"Reused cached audio {cache_key} for {s3_key}")
+        return head['ContentLength']
+    
+    def _store_in_tts_cache(self, s3_key: str, cache_key: str) -> None:
+        """
+        Copy freshly generated audio into the TTS cache (best effort)
+        
+        Args:
+            s3_key: The S3 key of the episode file
+            cache_key: The S3 key for the cached audio
+        """
+        try:
+            self.s3_client.copy_object(
+                Bucket=Config.S3_BUCKET_NAME,
+                Key=cache_key,
+                CopySource={'Bucket': Config.S3_BUCKET_NAME, 'Key': s3_key}
+            )
+        except Exception as e:
+            logger.warning(f"Error storing audio in TTS cache: {str(e)}")
+    
+    def _split_into_segments(self, text: str) -> List[str]:
+        """
+        Split text into segments of whole sentences for parallel synthesis
+        
+        Args:
+            text: The text to convert to speech
+            
+        Returns:
+            Segments of roughly TTS_SEGMENT_WORDS words each, in order
+        """
+        segments = []
+        current = []
+        current_words = 0
+        
+        for sentence in _SENTENCE_END_RE.split(text.strip()):
+            sentence_words = len(sentence.split())
+            if current and current_words + sentence_words > self.TTS_SEGMENT_WORDS:
+                segments.append(" ".join(current))
+                current = []
+                current_words = 0
+            current.append(sentence)
+            current_words += sentence_words
+        
+        if current:
+            segments.append(" ".join(current))
+        
+        return segments
+    
+    def _iter_tts_audio(self, text: str, voice_id: str) -> Iterator[bytes]:
+        """
+        Generate MP3 audio for the text as an ordered stream of byte chunks
+        
+        Text of up to TTS_SEGMENT_WORDS words is streamed from a single request.
+        Longer text, which includes every episode that passes content validation,
+        is split into sentence segments that are synthesized concurrently and
+        yielded in order as whole segments; MP3 streams with identical encoding
+        settings can be concatenated byte-wise.
+        
+        Args:
+            text: The text to convert to speech
+            voice_id: The voice ID to use
+            
+        Yields:
+            Chunks of MP3 audio
+        """
+        segments = self._split_into_segments(text)
+        
+        if len(segments) <= 1:
+            with self._tts_stream(text, voice_id) as response:
+                # Small chunks keep time-to-first-byte low on the narrower 64 kbps stream
+                for chunk in response.iter_content(chunk_size=8 * 1024):
+                    if chunk:
+                        yield chunk
+            return
+        
+        logger.info(f"Synthesizing {len(segments)} segments in parallel")
+        with ThreadPoolExecutor(max_workers=self.TTS_WORKERS) as executor:
+            futures = [
+                executor.submit(self._synthesize_segment, segments, index, voice_id)
+                for index in range(len(segments))
+            ]
+            try:
+                for future in futures:
+                    yield future.result()
+            finally:
+                # Stop pending segments if the consumer gave up early
+                for future in futures:
+                    future.cancel()
+    
+    def _synthesize_segment(self, segments: List[str], index: int, voice_id: str) -> bytes:
+        """
+        Synthesize one segment, passing its neighbours for natural prosody
+        
+        Args:
+            segments: All segments of the script
+            index: Index of the segment to synthesize
+            voice_id: The voice ID to use
+            
+        Returns:
+            MP3 audio for the segment
+        """
+        with self._tts_stream(
+            segments[index],
+            voice_id,
+            previous_text=segments[index - 1] if index > 0 else None,
+            next_text=segments[index + 1] if index + 1 < len(segments) else None
+        ) as response:
+            # Segments are yielded whole and in order, so each one is buffered
+            return response.content
+    
+    @contextmanager
+    def _tts_stream(self, text: str, voice_id: str,
+                    previous_text: Optional[str] = None,
+                    next_text: Optional[str] = None) -> Iterator[requests.Response]:
+        """
+        Open a streaming text-to-speech request to the ElevenLabs API
+        
+        The request holds one of the process-wide MAX_TTS_REQUESTS slots until the
+        response is closed on leaving the context.
+        
+        Args:
+            text: The text to convert to speech
+            voice_id: The voice ID to use
+            previous_text: Optional text spoken before this request, for continuity
+            next_text: Optional text spoken after this request, for continuity
+            
+        Yields:
+            Streaming response whose body is the MP3 audio
         """
         tts_url = f"{self.base_url}/text-to-speech/{voice_id}/stream"
         
         headers = {
-            "Accept": "application/json",
+            "Accept": "audio/mpeg",
             "xi-api-key": self.api_key
         }
         
@@ -93,69 +291,211 @@ class TTSService:
             "model_id": Config.TTS_CONFIG["model_id"],
             "voice_settings": Config.TTS_CONFIG["voice_settings"]
         }
+        if previous_text:
+            data["previous_text"] = previous_text
+        if next_text:
+            data["next_text"] = next_text
         
-        try:
-            response = requests.post(tts_url, headers=headers, json=data, stream=True)
-            
-            if response.status_code == 200:
-                audio_stream = BytesIO()
-                for chunk in response.iter_content(chunk_size=1024):
-                    if chunk:
-                        audio_stream.write(chunk)
-                audio_stream.seek(0)
-                return audio_stream
-            else:
-                error_msg = f"TTS API request failed with status {response.status_code}: {response.text}"
+        with self._tts_request_slots:
+            try:
+                response = self.session.post(
+                    tts_url,
+                    headers=headers,
+                    params={"output_format": Config.TTS_CONFIG["output_format"]},
+                    json=data,
+                    stream=True
+                )
+            except requests.exceptions.RequestException as e:
+                error_msg = f"Network error during TTS generation: {str(e)}"
                 logger.error(error_msg)
                 raise TTSServiceError(error_msg)
+            
+            try:
+                if response.status_code != 200:
+                    error_msg = f"TTS API request failed with status {response.status_code}: {response.text}"
+                    logger.error(error_msg)
+                    raise TTSServiceError(error_msg)
                 
-        except requests.exceptions.RequestException as e:
-            error_msg = f"Network error during TTS generation: {str(e)}"
-            logger.error(error_msg)
-            raise TTSServiceError(error_msg)
+                yield response
+            finally:
+                response.close()
     
-    def _upload_to_s3(self, audio_stream: BytesIO, s3_key: str) -> None:
+    def _stream_tts_to_s3(self, text: str, voice_id: str, s3_key: str) -> int:
         """
-        Upload audio stream to S3
+        Stream generated audio into S3
+        
+        Audio that fits under SINGLE_PUT_MAX_SIZE is stored with a single
+        put_object carrying a Content-MD5 checksum. Longer audio switches to a
+        multipart upload whose parts are uploaded while the TTS audio is still
+        arriving, so only a few parts are held in memory.
         
         Args:
-            audio_stream: The audio data as BytesIO
+            text: The text to convert to speech
+            voice_id: The voice ID to use
             s3_key: The S3 key for the file
+            
+        Returns:
+            Size of the uploaded audio in bytes
         """
+        audio_chunks = self._iter_tts_audio(text, voice_id)
+        metadata = {
+            'generated_at': datetime.utcnow().isoformat(),
+            'source': 'metrovoice_podcast_automation'
+        }
+        upload_id = None
+        
         try:
-            self.s3_client.upload_fileobj(
-                audio_stream,
-                Config.S3_BUCKET_NAME,
-                s3_key,
-                ExtraArgs={
-                    'ContentType': 'audio/mpeg',
-                    'Metadata': {
-                        'generated_at': datetime.utcnow().isoformat(),
-                        'source': 'metrovoice_podcast_automation'
-                    }
-                }
+            total_size = 0
+            buffer = bytearray()
+            futures = []
+            
+            with ThreadPoolExecutor(max_workers=self.UPLOAD_WORKERS) as executor:
+                for chunk in audio_chunks:
+                    buffer += chunk
+                    total_size += len(chunk)
+                    
+                    if upload_id is None:
+                        # Only start a multipart upload once the audio outgrows a single PUT
+                        if len(buffer) < self.SINGLE_PUT_MAX_SIZE:
+                            continue
+                        upload_id = self._create_multipart_upload(s3_key, metadata)
+                    
+                    if len(buffer) >= self.S3_PART_SIZE:
+                        # Wait for the oldest in-flight part so buffered parts stay bounded
+                        if len(futures) >= self.UPLOAD_WORKERS:
+                            futures[-self.UPLOAD_WORKERS].result()
+                        futures.append(executor.submit(
+                            self._upload_part, s3_key, upload_id, len(futures) + 1, bytes(buffer)
+                        ))
+                        buffer = bytearray()
+                
+                if total_size == 0:
+                    raise TTSServiceError("TTS API returned no audio")
+                
+                if upload_id is None:
+                    self._put_audio_object(s3_key, bytes(buffer), metadata)
+                    logger.info(f"Audio file uploaded to S3: {s3_key} (single PUT)")
+                    return total_size
+                
+                if buffer:
+                    futures.append(executor.submit(
+                        self._upload_part, s3_key, upload_id, len(futures) + 1, bytes(buffer)
+                    ))
+                
+                parts = [future.result() for future in futures]
+            
+            self.s3_client.complete_multipart_upload(
+                Bucket=Config.S3_BUCKET_NAME,
+                Key=s3_key,
+                UploadId=upload_id,
+                MultipartUpload={'Parts': parts}
             )
-            logger.info(f"Audio file uploaded to S3: {s3_key}")
+            logger.info(f"Audio file uploaded to S3: {s3_key} ({len(parts)} parts)")
+            return total_size
+            
+        except Exception:
+            if upload_id is not None:
+                try:
+                    self.s3_client.abort_multipart_upload(
+                        Bucket=Config.S3_BUCKET_NAME,
+                        Key=s3_key,
+                        UploadId=upload_id
+                    )
+                except Exception as abort_error:
+                    logger.warning(f"Error aborting S3 upload: {str(abort_error)}")
+            raise
+        finally:
+            audio_chunks.close()
+    
+    def _create_multipart_upload(self, s3_key: str, metadata: Dict[str, str]) -> str:
+        """
+        Start a multipart upload for the audio file
+        
+        Args:
+            s3_key: The S3 key for the file
+            metadata: Object metadata to store with the file
             
+        Returns:
+            The multipart upload ID
+        """
+        try:
+            return self.s3_client.create_multipart_upload(
+                Bucket=Config.S3_BUCKET_NAME,
+                Key=s3_key,
+                ContentType='audio/mpeg',
+                Metadata=metadata
+            )['UploadId']
         except Exception as e:
-            error_msg = f"Error uploading to S3: {str(e)}"
+            error_msg = f"Error starting S3 upload: {str(e)}"
             logger.error(error_msg)
             raise TTSServiceError(error_msg)
     
+    def _put_audio_object(self, s3_key: str, data: bytes, metadata: Dict[str, str]) -> None:
+        """
+        Upload a short audio file with one PUT, verified by S3 against its MD5
+        
+        Args:
+            s3_key: The S3 key for the file
+            data: The complete audio file
+            metadata: Object metadata to store with the file
+        """
+        content_md5 = base64.b64encode(hashlib.md5(data, usedforsecurity=False).digest()).decode()
+        self.s3_client.put_object(
+            Bucket=Config.S3_BUCKET_NAME,
+            Key=s3_key,
+            Body=data,
+            ContentType='audio/mpeg',
+            ContentMD5=content_md5,
+            Metadata=metadata
+        )
+    
+    def _upload_part(self, s3_key: str, upload_id: str, part_number: int,
+                     data: bytes) -> Dict[str, Any]:
+        """
+        Upload a single part of a multipart upload
+        
+        Args:
+            s3_key: The S3 key for the file
+            upload_id: The multipart upload ID
+            part_number: 1-based part number
+            data: The part contents
+            
+        Returns:
+            Part descriptor for complete_multipart_upload
+        """
+        response = self.s3_client.upload_part(
+            Bucket=Config.S3_BUCKET_NAME,
+            Key=s3_key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data
+        )
+        return {'PartNumber': part_number, 'ETag': response['ETag']}
+    
     def get_audio_duration(self, audio_stream: BytesIO) -> Optional[float]:
         """
-        Estimate audio duration (approximate)
+        Get audio duration from the MP3 headers (approximate without mutagen)
         
         Args:
             audio_stream: The audio data
             
         Returns:
-            Estimated duration in seconds
+            Duration in seconds
         """
+        if MP3 is not None:
+            try:
+                # mutagen only reads the frame headers it needs, not the whole stream
+                audio_stream.seek(0)
+                return MP3(audio_stream).info.length
+            except Exception as e:
+                logger.warning(f"Could not parse MP3 headers, estimating duration: {str(e)}")
+            finally:
+                audio_stream.seek(0)
+        
         try:
-            # This is a rough estimation - in production you might want to use a proper audio library
-            file_size = len(audio_stream.getvalue())
-            # Rough estimation: 1MB ≈ 1 minute of audio at typical podcast quality
+            # Rough estimation from the buffer size: 1MB ≈ 1 minute of audio
+            with audio_stream.getbuffer() as view:
+                file_size = view.nbytes
             estimated_duration = (file_size / (1024 * 1024)) * 60
             return estimated_duration
         except Exception as e: